@@ -3,8 +3,16 @@ AI Prompt Templates and Generator Functions
 Extracted from api_server.py to improve code organization and maintainability.
 """
 
+import logging
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 from fastapi import HTTPException
 
+logger = logging.getLogger(__name__)
+
 
 # Style mapping for different templates
 STYLE_PROMPTS = {
@@ -133,122 +141,225 @@ maintain natural beauty. After following the guidelines above, adapt the image u
 }
 
 
+def _freeze(d: dict) -> MappingProxyType:
+    """Recursively wrap a nested dict in read-only mappings with interned string keys"""
+    return MappingProxyType({
+        (sys.intern(k) if isinstance(k, str) else k): (_freeze(v) if isinstance(v, dict) else v)
+        for k, v in d.items()
+    })
+
+
+# The style table is static; freeze it so nothing can mutate it at runtime
+STYLE_PROMPTS = _freeze(STYLE_PROMPTS)
+
+
+# Runs of whitespace (including newlines) in the multi-line prompt strings
+_WS_RE = re.compile(r"\s+")
+
+
+def _compile() -> dict:
+    """Pre-build the static prompt strings for every (template_id, style) pair"""
+    compiled = {}
+
+    # Funny-toon prompts are multi-line in the table above; collapse the whitespace once here
+    for style, style_prompt in STYLE_PROMPTS["funny-toon"]["styles"].items():
+        compiled[("funny-toon", style)] = _WS_RE.sub(" ", style_prompt).strip()
+
+    retro_config = STYLE_PROMPTS["retro-remix"]
+    for keyword, style_desc in retro_config["keywords"].items():
+        compiled[("retro-remix", keyword)] = (
+            f"{retro_config['base']}\n\n"
+            f"STYLE VARIATION - {keyword}: {style_desc}."
+        )
+
+    cover_config = STYLE_PROMPTS["cover-shoot"]
+    for style, style_desc in cover_config["styles"].items():
+        compiled[("cover-shoot", style)] = (
+            f"{cover_config['base']}\n\n"
+            f"STYLE VARIATION - {style}: {style_desc}"
+        )
+
+    return compiled
+
+
+# Fully-formatted prompts keyed by (template_id, style); built once at import time
+_COMPILED_PROMPTS = MappingProxyType(_compile())
+
+# Case-insensitive retro-remix keyword lookup (lowercase keyword -> description)
+_RETRO_KEYWORDS = {k.lower(): v for k, v in STYLE_PROMPTS["retro-remix"]["keywords"].items()}
+
+
+def _index_styles(styles: dict) -> dict:
+    """Map lowercase style name -> (style name, description), keeping the first match like a linear scan would"""
+    index = {}
+    for name, desc in styles.items():
+        index.setdefault(name.lower(), (name, desc))
+    return index
+
+
+# Case-insensitive style lookup per template (template_id -> lowercase style -> (style, description))
+_CI_STYLES = {tid: _index_styles(cfg.get("styles", {})) for tid, cfg in STYLE_PROMPTS.items()}
+
+# Footy-fan text pre-split around the {TEAM_NAME} placeholder so the team is spliced in with a join
+_FOOTY_BASE = tuple(STYLE_PROMPTS["footy-fan"]["base"].split("{TEAM_NAME}"))
+_FOOTY_STYLES = {
+    key: tuple(desc.split("{TEAM_NAME}"))
+    for key, (_, desc) in _CI_STYLES["footy-fan"].items()
+}
+
+
+# style_params keys that affect the generated prompt, and a marker for keys the caller left out
+_PROMPT_FIELDS = ("style", "keyword", "optional_text", "team")
+_UNSET = object()
+
+
 def generate_style_prompt(template_id: str, style_params: dict) -> str:
     """Generate optimized prompts for cartoon and image transformation"""
     
-    if template_id not in STYLE_PROMPTS:
-        return f"Transform this image with {style_params.get('style', 'artistic')} effects"
-    
-    template_config = STYLE_PROMPTS[template_id]
-    
-    # Special handling for funny-toon with optimized cartoon prompts
-    if template_id == "funny-toon":
-        style = style_params.get('style', 'Wild and Wacky')
-        
-        # Get the detailed style prompt
-        if style in template_config.get("styles", {}):
-            style_prompt = template_config["styles"][style]
-            
-            # Clean up the prompt (remove extra whitespace)
-            style_prompt = " ".join(style_prompt.split())
-            
-            print(f"Funny-toon style prompt: {style_prompt}")
-            return style_prompt
-        else:
-            return f"Transform this person into a smooth, funny cartoon character with {style} style"
-    
-    # Handle other template types
-    elif template_id == "retro-remix":
-        # Build the Retro Remix prompt by combining the shared base instructions with an optional style keyword.
-        keyword = style_params.get("keyword", "Retro")
-
-        # If the keyword matches one of our predefined style keywords, fetch its detailed description – otherwise fall back
-        # to using the raw keyword directly in a generalized sentence.  The important change here is that we no longer
-        # replace the entire base prompt with the keyword description; instead, we APPEND the keyword description so the
-        # AI always receives the full guidance from the base prompt first, followed by the specific style variation.
-
-        # Perform a case-insensitive lookup for the keyword inside our predefined keywords map.
-        keyword_map = {k.lower(): v for k, v in template_config.get("keywords", {}).items()}
-
-        if keyword.lower() in keyword_map:
-            style_desc = keyword_map[keyword.lower()]
-            prompt = (
-                f"{template_config['base']}\n\n"
-                f"STYLE VARIATION - {keyword}: {style_desc}."
-            )
-        else:
-            # Unknown keyword – provide a generic instruction referencing the user-supplied keyword so the model still
-            # attempts to incorporate it.
-            prompt = (
-                f"{template_config['base']}\n\n"
-                f"STYLE VARIATION - {keyword}: apply retro-inspired elements that embody '{keyword}'."
-            )
-
-        # Append optional text if provided (e.g., custom slogan on the case)
-        optional_text = style_params.get("optional_text", "").strip()
-        if optional_text:
-            prompt += f"\n\nInclude the text: '{optional_text}'."
+    if isinstance(template_id, str):
+        template_id = sys.intern(template_id)
 
-        return prompt
-    
-    # --- Handle cover-shoot with style variations ---
-    elif template_id == "cover-shoot":
-        # Get the selected style from parameters
-        style = style_params.get("style", "")
-        
-        # If a style is specified and exists in our styles, combine base prompt with style
-        if style and style in template_config.get("styles", {}):
-            style_desc = template_config["styles"][style]
-            prompt = (
-                f"{template_config['base']}\n\n"
-                f"STYLE VARIATION - {style}: {style_desc}"
-            )
-            return prompt
-        else:
-            # No style specified or style not found, return just the base prompt
-            return template_config["base"]
-    
-    # Glitch-pro keeps mode-based styles
-    elif template_id == "glitch-pro":
-        # Retrieve requested style (default to first style if none provided)
-        requested_style = style_params.get('style', list(template_config.get('styles', {}).keys())[0])
-
-        # Normalize style lookup to be case-insensitive
-        styles_dict = template_config.get("styles", {})
-        matched_key = next((k for k in styles_dict.keys() if k.lower() == requested_style.lower()), None)
-
-        if matched_key is not None:
-            style_desc = styles_dict[matched_key]
-            # Prefix with a generic instruction. We purposely do **not** rely on a missing
-            # `base` key so we don't raise KeyError if it isn't present.
-            return f"Transform this image into {style_desc}"
-
-        # No fallback - raise error if style not found
-        raise HTTPException(status_code=400, detail=f"Unknown glitch-pro style: {requested_style}. Available styles: {list(styles_dict.keys())}")
+    # Prompts are pure functions of these fields, so identical requests are served from the cache
+    key = tuple(style_params.get(field, _UNSET) for field in _PROMPT_FIELDS)
+    try:
+        hash(key)
+    except TypeError:
+        return _build_style_prompt(template_id, style_params)
+    return _cached_prompt(template_id, *key)
+
+
+@lru_cache(maxsize=512)
+def _cached_prompt(template_id, style, keyword, optional_text, team) -> str:
+    """Memoized wrapper around _build_style_prompt keyed on the prompt fields"""
+    values = (style, keyword, optional_text, team)
+    style_params = {field: value for field, value in zip(_PROMPT_FIELDS, values) if value is not _UNSET}
+    return _build_style_prompt(template_id, style_params)
+
+
+def _handle_funny_toon(style_params: dict, template_config) -> str:
+    """Special handling for funny-toon with optimized cartoon prompts"""
+    style = style_params.get('style', 'Wild and Wacky')
     
-    elif template_id == "footy-fan":
-        # Build base prompt, replacing the TEAM_NAME placeholder
-        team = style_params.get('team', 'football team')
-        requested_style = style_params.get('style', '').strip() or 'Team Colors'
-
-        # Replace placeholder {TEAM_NAME} in the base prompt while preserving the rest of the text
-        base_prompt = template_config["base"].format(TEAM_NAME=team)
-
-        # Prepare case-insensitive style lookup
-        styles_dict = template_config.get("styles", {})
-        matched_key = next((k for k in styles_dict.keys() if k.lower() == requested_style.lower()), None)
-
-        if matched_key:
-            # Use the predefined style description and inject the team name where applicable
-            style_desc = styles_dict[matched_key].format(TEAM_NAME=team)
-            return f"{base_prompt} {style_desc}"
-        else:
-            # Fallback: just mention the style name if it isn't predefined
-            return f"{base_prompt} Add a '{requested_style}' themed background or effects that showcase {team}."
+    # Get the detailed style prompt (whitespace already collapsed at import time)
+    style_prompt = _COMPILED_PROMPTS.get(("funny-toon", style))
+    if style_prompt is not None:
+        logger.debug("Funny-toon style prompt: %s", style_prompt)
+        return style_prompt
+    else:
+        return f"Transform this person into a smooth, funny cartoon character with {style} style"
+
+
+def _handle_retro_remix(style_params: dict, template_config) -> str:
+    """Build the Retro Remix prompt by combining the shared base instructions with an optional style keyword"""
+    keyword = style_params.get("keyword", "Retro")
+
+    # If the keyword matches one of our predefined style keywords, fetch its detailed description – otherwise fall back
+    # to using the raw keyword directly in a generalized sentence.  The important change here is that we no longer
+    # replace the entire base prompt with the keyword description; instead, we APPEND the keyword description so the
+    # AI always receives the full guidance from the base prompt first, followed by the specific style variation.
+
+    # Exact keyword matches were pre-built at import; otherwise fall back to a case-insensitive lookup.
+    prompt = _COMPILED_PROMPTS.get(("retro-remix", keyword))
+
+    if prompt is None and keyword.lower() in _RETRO_KEYWORDS:
+        style_desc = _RETRO_KEYWORDS[keyword.lower()]
+        prompt = (
+            f"{template_config['base']}\n\n"
+            f"STYLE VARIATION - {keyword}: {style_desc}."
+        )
+    elif prompt is None:
+        # Unknown keyword – provide a generic instruction referencing the user-supplied keyword so the model still
+        # attempts to incorporate it.
+        prompt = (
+            f"{template_config['base']}\n\n"
+            f"STYLE VARIATION - {keyword}: apply retro-inspired elements that embody '{keyword}'."
+        )
+
+    # Append optional text if provided (e.g., custom slogan on the case)
+    optional_text = style_params.get("optional_text", "").strip()
+    if optional_text:
+        prompt += f"\n\nInclude the text: '{optional_text}'."
+
+    return prompt
+
+
+def _handle_cover_shoot(style_params: dict, template_config) -> str:
+    """Handle cover-shoot with style variations"""
+    # Get the selected style from parameters
+    style = style_params.get("style", "")
     
+    # If a style is specified and exists in our styles, return the pre-built base + style prompt
+    prompt = _COMPILED_PROMPTS.get(("cover-shoot", style))
+    if prompt is not None:
+        return prompt
+    else:
+        # No style specified or style not found, return just the base prompt
+        return template_config["base"]
+
+
+def _handle_glitch_pro(style_params: dict, template_config) -> str:
+    """Glitch-pro keeps mode-based styles"""
+    # Retrieve requested style (default to first style if none provided)
+    requested_style = style_params.get('style', list(template_config.get('styles', {}).keys())[0])
+
+    # Case-insensitive style lookup against the index built at import time
+    matched = _CI_STYLES["glitch-pro"].get(requested_style.lower())
+
+    if matched is not None:
+        style_desc = matched[1]
+        # Prefix with a generic instruction. We purposely do **not** rely on a missing
+        # `base` key so we don't raise KeyError if it isn't present.
+        return f"Transform this image into {style_desc}"
+
+    # No fallback - raise error if style not found
+    raise HTTPException(status_code=400, detail=f"Unknown glitch-pro style: {requested_style}. Available styles: {list(template_config.get('styles', {}).keys())}")
+
+
+def _handle_footy_fan(style_params: dict, template_config) -> str:
+    """Build the footy-fan prompt, replacing the TEAM_NAME placeholder"""
+    team = style_params.get('team', 'football team')
+    requested_style = style_params.get('style', '').strip() or 'Team Colors'
+
+    # Replace placeholder {TEAM_NAME} in the base prompt while preserving the rest of the text
+    team_name = str(team)
+    base_prompt = team_name.join(_FOOTY_BASE)
+
+    # Case-insensitive style lookup against the index built at import time
+    matched = _FOOTY_STYLES.get(requested_style.lower())
+
+    if matched:
+        # Use the predefined style description and inject the team name where applicable
+        style_desc = team_name.join(matched)
+        return f"{base_prompt} {style_desc}"
+    else:
+        # Fallback: just mention the style name if it isn't predefined
+        return f"{base_prompt} Add a '{requested_style}' themed background or effects that showcase {team}."
+
+
+def _handle_default(style_params: dict, template_config) -> str:
+    """Generic prompt for templates without a dedicated handler"""
     # Add optional text if provided
     optional_text = style_params.get('optional_text', '')
     if optional_text:
         return f"{template_config['base']} Include text: '{optional_text}'"
     
-    return template_config["base"]
\ No newline at end of file
+    return template_config["base"]
+
+
+# Prompt builder per template_id
+_HANDLERS = {
+    "funny-toon": _handle_funny_toon,
+    "retro-remix": _handle_retro_remix,
+    "cover-shoot": _handle_cover_shoot,
+    "glitch-pro": _handle_glitch_pro,
+    "footy-fan": _handle_footy_fan,
+}
+
+
+def _build_style_prompt(template_id: str, style_params: dict) -> str:
+    """Build the prompt for a template from its style parameters"""
+    template_config = STYLE_PROMPTS.get(template_id)
+    if template_config is None:
+        return f"Transform this image with {style_params.get('style', 'artistic')} effects"
+
+    return _HANDLERS.get(template_id, _handle_default)(style_params, template_config)
@@ -4,8 +4,9 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends, Request
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import IntegrityError
 from fastapi.staticfiles import StaticFiles
 
 # Standard library imports
@@ -19,9 +20,11 @@ import uuid
 import json
 import stripe
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Database imports
-from database import get_db, create_tables
+from database import get_db, create_tables, engine
 from db_services import OrderService, OrderImageService, BrandService, PhoneModelService, TemplateService
 from models import PhoneModel, Template, VendingMachine, VendingMachineSession, Order, OrderImage
 
@@ -64,7 +67,9 @@ from backend.services.image_service import convert_image_for_api, save_generated
 from backend.services.file_service import generate_uk_download_url, generate_secure_download_token
 from backend.services.payment_service import initialize_stripe
 from backend.utils.helpers import generate_third_id, get_mobile_model_id
-from backend.middleware.exception_handlers import validation_exception_handler
+from backend.middleware.exception_handlers import validation_exception_handler, integrity_error_handler, unhandled_exception_handler
+from backend.middleware.request_id import RequestIDMiddleware
+from backend.middleware.gzip import JSONGZipMiddleware
 
 # SQLAlchemy imports
 from sqlalchemy.orm import Session, joinedload
@@ -75,40 +80,58 @@ from datetime import datetime, timezone
 stripe_client = initialize_stripe()
 
 # Configure logging
+# Records are queued and written to stdout/file by a background thread, so request
+# handlers never block on log I/O
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler('pimpmycase_api.log', encoding='utf-8')
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pimpmycase_api.log', encoding='utf-8')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
 
 # Set specific loggers
 logger = logging.getLogger(__name__)
-logging.getLogger('backend.services.chinese_payment_service').setLevel(logging.DEBUG)
+# Set CHINESE_API_LOG_LEVEL=INFO to skip pretty-printing full Chinese API response bodies
+logging.getLogger('backend.services.chinese_payment_service').setLevel(os.getenv('CHINESE_API_LOG_LEVEL', 'DEBUG').upper())
 logging.getLogger('requests').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 # Database lifespan event handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup"""
+    """Initialize database on startup and release pooled connections on shutdown"""
     try:
         create_tables()
         print("Database tables created/verified")
     except Exception as e:
         print(f"Database initialization error: {e}")
     yield
+    engine.dispose()
+    _log_listener.stop()
 
 # Initialize FastAPI app
-app = FastAPI(title=API_TITLE, version=API_VERSION, lifespan=lifespan)
+app = FastAPI(title=API_TITLE, version=API_VERSION, lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(CORSMiddleware, **CORS_CONFIG)
 
+# Compress larger JSON responses (catalog lists, admin order dumps) for clients that accept gzip;
+# images and static assets are passed through with their Content-Length intact
+app.add_middleware(JSONGZipMiddleware, minimum_size=1000, compresslevel=5)
+
+# Tag each request with an id that error responses and logs can be correlated by
+app.add_middleware(RequestIDMiddleware)
+
 # Add exception handlers
 app.exception_handler(RequestValidationError)(validation_exception_handler)
+app.exception_handler(IntegrityError)(integrity_error_handler)
+app.exception_handler(Exception)(unhandled_exception_handler)
 
 # Include API routes FIRST (higher priority)
 app.include_router(router)
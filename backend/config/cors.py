@@ -55,4 +55,5 @@ CORS_CONFIG = {
     "allow_credentials": True,
     "allow_methods": ALLOWED_METHODS,
     "allow_headers": ALLOWED_HEADERS,
+    "max_age": 86400,  # Let browsers reuse preflight results for a day (CORSMiddleware answers them before routing)
 }
\ No newline at end of file
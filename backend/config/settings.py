@@ -34,6 +34,8 @@ CHINESE_API_SYSTEM_NAME = os.getenv('CHINESE_API_SYSTEM_NAME', 'mobileShell')
 CHINESE_API_FIXED_KEY = os.getenv('CHINESE_API_FIXED_KEY', 'shfoa3sfwoehnf3290rqefiz4efd')
 CHINESE_API_DEVICE_ID = os.getenv('CHINESE_API_DEVICE_ID', '1CBRONIQRWQQ')
 CHINESE_API_TIMEOUT = int(os.getenv('CHINESE_API_TIMEOUT', '30'))
+# Keep-alive connections each Chinese API client keeps open to the API host (roughly the threadpool size)
+CHINESE_API_POOL_SIZE = int(os.getenv('CHINESE_API_POOL_SIZE', '40'))
 
 # File Storage Configuration
 GENERATED_IMAGES_DIR = "generated-images"
@@ -1,13 +1,58 @@
 """Exception handlers for the API"""
 
+import logging
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import IntegrityError
+from backend.config.cors import CORS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Same origin rules as the app's CORSMiddleware. Starlette sends the catch-all Exception handler's
+# response from ServerErrorMiddleware, outside CORSMiddleware and RequestIDMiddleware, so those
+# headers have to be added here for browsers to be able to read the 500.
+_cors = CORSMiddleware(app=None, **CORS_CONFIG)
+
+def _cors_headers(request: Request) -> dict:
+    """CORS response headers for the request's Origin, if it is allowed"""
+    origin = request.headers.get("origin")
+    if not origin or not _cors.is_allowed_origin(origin):
+        return {}
+    headers = dict(_cors.simple_headers)
+    headers["Access-Control-Allow-Origin"] = origin
+    headers["Vary"] = "Origin"
+    return headers
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
-    print(f"Validation error for {request.url}: {exc.errors()}")
+    logger.warning("Validation error for %s: %s", request.url, exc.errors())
     return JSONResponse(
         status_code=422,
         content={"detail": f"Validation error: {exc.errors()}"}
-    )
\ No newline at end of file
+    )
+
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    """Report constraint violations (foreign keys, unique keys) as conflicts"""
+    logger.warning("Integrity error for %s: %s", request.url, exc.orig)
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "Request conflicts with existing data"}
+    )
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Catch-all for errors a route didn't translate into an HTTPException
+    
+    The error text stays in the logs; clients only get the request id to quote.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    logger.error("Unhandled error for %s %s (request_id=%s)", request.method, request.url.path, request_id, exc_info=exc)
+    headers = _cors_headers(request)
+    if request_id:
+        headers["X-Request-ID"] = request_id
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error", "request_id": request_id},
+        headers=headers
+    )
@@ -0,0 +1,30 @@
+"""Gzip compression limited to JSON responses"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+class JSONGZipResponder(GZipResponder):
+    """GZipResponder that passes non-JSON responses through untouched
+
+    Images and static assets are either already compressed or cheap to send as-is; re-deflating
+    them on every request burns CPU and drops their Content-Length.
+    """
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if not content_type.startswith("application/json"):
+                # Reuse Starlette's pass-through path for responses that set their own encoding
+                self.content_encoding_set = True
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that only compresses application/json responses"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = JSONGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
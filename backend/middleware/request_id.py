@@ -0,0 +1,28 @@
+"""Per-request correlation id"""
+
+import uuid
+from starlette.datastructures import MutableHeaders
+
+class RequestIDMiddleware:
+    """Give every HTTP request an id (request.state.request_id) and echo it as X-Request-ID
+
+    Written as plain ASGI middleware so it doesn't add a BaseHTTPMiddleware task per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
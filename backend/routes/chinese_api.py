@@ -289,7 +289,7 @@ async def chinese_system_order_status_update(
         body = await request.body()
         
         logger.info(f"Chinese order status update received")
-        logger.info(f"Request headers: {dict(request.headers)}")
+        logger.debug("Request headers: %s", request.headers)
         logger.info(f"Request body: {body.decode('utf-8') if body else 'Empty'}")
         
         # Try to parse JSON if available
@@ -370,8 +370,7 @@ async def chinese_system_order_status_update(
         # Try to update order if order_id is available
         if order_id:
             try:
-                order = OrderService.get_order_by_id(db, order_id)
-                if order:
+                if OrderService.order_exists(db, order_id):
                     update_data = {}
                     if status:
                         update_data["status"] = str(status)
@@ -415,8 +414,8 @@ async def send_print_command(
 ):
     """Send print command to Chinese manufacturers"""
     try:
-        # Validate order exists
-        order = OrderService.get_order_by_id(db, request.order_id)
+        # Validate order exists (brand, model and template names are used below)
+        order = OrderService.get_order_with_details(db, request.order_id, include_images=False)
         if not order:
             raise HTTPException(status_code=404, detail=f"Order not found: {request.order_id}")
         
@@ -12,7 +12,7 @@ from backend.utils.helpers import generate_third_id
 from backend.config.settings import JWT_SECRET_KEY
 from ai_prompts import STYLE_PROMPTS, generate_style_prompt
 from db_services import OrderImageService
-import json
+import orjson
 import time
 import uuid
 import hmac
@@ -45,7 +45,7 @@ async def generate_image(
             print(f"🔄 API - image content_type: {image.content_type}")
         
         # Parse style parameters
-        style_data = json.loads(style_params)
+        style_data = orjson.loads(style_params)
         print(f"🔄 API - style_data: {style_data}")
         
         # Convert uploaded image if provided
@@ -127,7 +127,7 @@ async def generate_image(
             "order_id": order_id
         }
     
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid style_params JSON")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -171,8 +171,8 @@ async def upload_final_composed_image(
         
         # Parse metadata
         try:
-            metadata_dict = json.loads(metadata)
-        except json.JSONDecodeError:
+            metadata_dict = orjson.loads(metadata)
+        except orjson.JSONDecodeError:
             metadata_dict = {}
         
         # Validate base64 data
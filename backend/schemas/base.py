@@ -1,4 +1,8 @@
 """Base Pydantic models and common schemas"""
 
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
\ No newline at end of file
+from typing import Optional, Dict, Any
+
+class MessageResponse(BaseModel):
+    success: bool = True
+    message: str
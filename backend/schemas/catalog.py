@@ -0,0 +1,67 @@
+"""Catalog-related Pydantic models (templates, fonts, colors)"""
+
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Optional, List, Any
+
+class TemplateOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    price: float
+    currency: Optional[str] = None
+    category: str
+    image_count: Optional[int] = None
+    features: Optional[Any] = None
+    display_price: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class TemplateListResponse(BaseModel):
+    success: bool = True
+    templates: List[TemplateOut]
+
+class TemplateResponse(BaseModel):
+    success: bool = True
+    template: TemplateOut
+
+class FontOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    css_style: Optional[str] = None
+    font_weight: Optional[str] = None
+    is_google_font: Optional[bool] = None
+    google_font_url: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class FontListResponse(BaseModel):
+    success: bool = True
+    fonts: List[FontOut]
+
+class ColorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    hex_value: str
+    css_classes: Optional[Any] = None
+    color_type: str
+    is_active: Optional[bool] = None
+
+class ColorListResponse(BaseModel):
+    success: bool = True
+    colors: List[ColorOut]
+
+class TemplatePriceOut(BaseModel):
+    id: str
+    name: str
+    price: float
+    display_price: Optional[str] = None
+    updated_at: datetime
+
+class TemplatePriceResponse(BaseModel):
+    success: bool = True
+    template: TemplatePriceOut
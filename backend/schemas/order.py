@@ -0,0 +1,17 @@
+"""Order-related Pydantic models"""
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, Any
+
+class OrderImageOut(BaseModel):
+    id: str
+    order_id: str
+    image_path: str
+    image_type: Optional[str] = None
+    ai_params: Optional[Any] = None
+    created_at: datetime
+
+class OrderImageResponse(BaseModel):
+    success: bool = True
+    image: OrderImageOut
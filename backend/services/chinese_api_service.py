@@ -6,11 +6,13 @@ import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass
 from backend.config.settings import (
     CHINESE_API_BASE_URL, CHINESE_API_ACCOUNT, CHINESE_API_PASSWORD,
-    CHINESE_API_SYSTEM_NAME, CHINESE_API_FIXED_KEY, CHINESE_API_TIMEOUT
+    CHINESE_API_SYSTEM_NAME, CHINESE_API_FIXED_KEY, CHINESE_API_TIMEOUT, CHINESE_API_POOL_SIZE
 )
+from backend.utils.cache import TTLCache
 
 @dataclass
 class ChineseAPIConfig:
@@ -30,7 +32,12 @@ class ChineseAPIService:
         self.config = ChineseAPIConfig()
         self.token = None
         self.session = requests.Session()
+        # One instance (get_chinese_api_service) serves every sync route, so concurrent stock and
+        # payment calls draw from this pool instead of each opening a fresh TLS connection
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=CHINESE_API_POOL_SIZE))
         self._is_mock_mode = "localhost" in self.config.base_url.lower()
+        # Stock moves quickly, so lookups are only held briefly
+        self._stock_cache = TTLCache(ttl_seconds=10, maxsize=256)
 
         # Log which API mode is active
         if self._is_mock_mode:
@@ -168,17 +175,21 @@ class ChineseAPIService:
         
         return result
     
-    def get_brands(self) -> Dict[str, Any]:
-        """Get available brands from Chinese API"""
-        return self._make_request("brand/list", {})
-    
     def get_stock_models(self, device_id: str, brand_id: str) -> Dict[str, Any]:
-        """Get stock models for a specific device and brand"""
+        """Get stock models for a specific device and brand (successful results cached for 10 seconds)"""
+        cache_key = (device_id, brand_id)
+        cached = self._stock_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         payload = {
             "device_id": device_id,
             "brand_id": brand_id
         }
-        return self._make_request("stock/list", payload)
+        result = self._make_request("stock/list", payload)
+        if result.get("success"):
+            self._stock_cache.set(cache_key, result)
+        return result
     
     def send_payment_data(self, mobile_model_id: str, device_id: str, third_id: str, 
                          pay_amount: float, pay_type: int) -> Dict[str, Any]:
@@ -1,6 +1,7 @@
 """Chinese manufacturer payment API service with authentication and signature generation"""
 
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
 import json
 from datetime import datetime, timezone
@@ -12,7 +13,7 @@ from threading import Lock
 from backend.config.settings import (
     CHINESE_API_BASE_URL, CHINESE_API_ACCOUNT, CHINESE_API_PASSWORD,
     CHINESE_API_SYSTEM_NAME, CHINESE_API_FIXED_KEY, 
-    CHINESE_API_DEVICE_ID, CHINESE_API_TIMEOUT
+    CHINESE_API_DEVICE_ID, CHINESE_API_TIMEOUT, CHINESE_API_POOL_SIZE
 )
 
 # Set up logging
@@ -33,6 +34,9 @@ class ChinesePaymentAPIClient:
         self.token = None
         self.token_expires_at = None
         self.session = requests.Session()
+        # Signed requests all go to CHINESE_API_BASE_URL; pool them so the payment, brand and
+        # stock calls made through get_chinese_payment_client() skip the TLS handshake
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=CHINESE_API_POOL_SIZE))
         
         # CRITICAL FIX: Add caching to prevent redundant API calls
         self._brand_cache = {}
@@ -113,7 +117,8 @@ class ChinesePaymentAPIClient:
             
             if response.status_code == 200:
                 data = response.json()
-                logger.debug(f"Login response: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Login response: %s", json.dumps(data, indent=2, ensure_ascii=False))
                 
                 if data.get("code") == 200:
                     self.token = data["data"]["token"]
@@ -212,7 +217,8 @@ class ChinesePaymentAPIClient:
             }
             
             logger.info(f"=== PAYLOAD TO CHINESE API ===")
-            logger.info(f"Request payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Request payload: %s", json.dumps(payload, indent=2, ensure_ascii=False))
             
             # Generate signature
             logger.info("Generating signature...")
@@ -234,7 +240,8 @@ class ChinesePaymentAPIClient:
             safe_headers = headers.copy()
             if safe_headers.get("Authorization"):
                 safe_headers["Authorization"] = safe_headers["Authorization"][:20] + "..." if len(safe_headers["Authorization"]) > 20 else safe_headers["Authorization"]
-            logger.info(f"Headers: {json.dumps(safe_headers, indent=2, ensure_ascii=False)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Headers: %s", json.dumps(safe_headers, indent=2, ensure_ascii=False))
             
             # Make the request
             full_url = f"{self.base_url}/order/payData"
@@ -253,12 +260,13 @@ class ChinesePaymentAPIClient:
             
             logger.info(f"=== CHINESE API HTTP RESPONSE ===")
             logger.info(f"HTTP Status: {response.status_code} {response.reason}")
-            logger.info(f"Response headers: {dict(response.headers)}")
+            logger.debug("Response headers: %s", response.headers)
             
             if response.status_code == 200:
                 try:
                     data = response.json()
-                    logger.info(f"Response body: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Response body: %s", json.dumps(data, indent=2, ensure_ascii=False))
                     
                     # Check Chinese API response code
                     if data.get("code") == 200:
@@ -382,7 +390,8 @@ class ChinesePaymentAPIClient:
             
             if response.status_code == 200:
                 data = response.json()
-                logger.debug(f"Brand list response: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Brand list response: %s", json.dumps(data, indent=2, ensure_ascii=False))
                 
                 if data.get("code") == 200:
                     brands = data.get("data", [])
@@ -478,7 +487,8 @@ class ChinesePaymentAPIClient:
             
             if response.status_code == 200:
                 data = response.json()
-                logger.debug(f"Stock list response: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Stock list response: %s", json.dumps(data, indent=2, ensure_ascii=False))
                 
                 if data.get("code") == 200:
                     stock_items = data.get("data", [])
@@ -554,7 +564,8 @@ class ChinesePaymentAPIClient:
                 payload["pay_amount"] = pay_amount
             
             logger.info(f"=== PAYMENT STATUS PAYLOAD ===")
-            logger.info(f"Request payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Request payload: %s", json.dumps(payload, indent=2, ensure_ascii=False))
             
             # Generate signature
             signature = self.generate_signature(payload)
@@ -588,7 +599,8 @@ class ChinesePaymentAPIClient:
             if response.status_code == 200:
                 try:
                     data = response.json()
-                    logger.info(f"Response body: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Response body: %s", json.dumps(data, indent=2, ensure_ascii=False))
                     
                     if data.get("code") == 200:
                         logger.info(f"SUCCESS: Payment status sent successfully!")
@@ -704,7 +716,8 @@ class ChinesePaymentAPIClient:
             }
             
             logger.info(f"=== ORDER DATA PAYLOAD ===")
-            logger.info(f"Request payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Request payload: %s", json.dumps(payload, indent=2, ensure_ascii=False))
             
             # Generate signature
             signature = self.generate_signature(payload)
@@ -738,7 +751,8 @@ class ChinesePaymentAPIClient:
             if response.status_code == 200:
                 try:
                     data = response.json()
-                    logger.info(f"Response body: {json.dumps(data, indent=2, ensure_ascii=False)}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Response body: %s", json.dumps(data, indent=2, ensure_ascii=False))
                     
                     if data.get("code") == 200:
                         order_id = data.get('data', {}).get('id', 'N/A')
@@ -9,6 +9,15 @@ from backend.config.settings import UK_HOSTED_BASE_URL, JWT_SECRET_KEY, DEFAULT_
 
 logger = logging.getLogger(__name__)
 
+# HMAC keyed once with the JWT secret; each signature starts from a copy of it
+_token_hmac = hmac.new(JWT_SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+def _sign(message: str) -> str:
+    """Hex HMAC-SHA256 signature of a token message"""
+    signer = _token_hmac.copy()
+    signer.update(message.encode())
+    return signer.hexdigest()
+
 # Partner types for different access levels
 PARTNER_TYPES = {
     "chinese_manufacturing": {
@@ -34,17 +43,11 @@ def generate_uk_download_url(filename: str) -> str:
 
 def generate_secure_download_token(filename: str, expiry_hours: int = DEFAULT_TOKEN_EXPIRY_HOURS) -> str:
     """Generate secure download token for image access"""
-    # Use JWT secret as signing key
-    secret_key = JWT_SECRET_KEY
     timestamp = str(int(time.time() + (expiry_hours * 3600)))  # Expiry timestamp
     
     # Create signature
     message = f"{filename}:{timestamp}"
-    signature = hmac.new(
-        secret_key.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    signature = _sign(message)
     
     logger.info(f"Generated secure token for {filename} with {expiry_hours}h expiry")
     return f"{timestamp}:{signature}"
@@ -67,16 +70,11 @@ def generate_partner_specific_token(filename: str, partner_type: str = "end_user
         expiry_hours = partner_config["default_expiry_hours"]
     
     # Generate token with partner prefix for identification
-    secret_key = JWT_SECRET_KEY
     timestamp = str(int(time.time() + (expiry_hours * 3600)))
     
     # Include partner type in the signature for validation
     message = f"{filename}:{timestamp}:{partner_type}"
-    signature = hmac.new(
-        secret_key.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    signature = _sign(message)
     
     token = f"{timestamp}:{partner_type}:{signature}"
     logger.info(f"Generated {partner_type} token for {filename} with {expiry_hours}h expiry")
@@ -127,11 +125,7 @@ def validate_secure_token(token: str, filename: str, allow_partner_types: Option
             return {"valid": False, "error": "Token expired"}
         
         # Verify signature
-        expected_signature = hmac.new(
-            JWT_SECRET_KEY.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        expected_signature = _sign(message)
         
         if not hmac.compare_digest(signature, expected_signature):
             logger.warning(f"Token validation failed - invalid signature for {filename}")
@@ -0,0 +1,72 @@
+"""Small in-process caching helpers for read-mostly API data"""
+
+import time
+import hashlib
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Any, Hashable, Optional
+from fastapi import Request
+
+class TTLCache:
+    """Thread-safe dict cache whose entries expire after ttl_seconds
+
+    Entries are stored as (value, timestamp) like the Chinese API client caches.
+    When maxsize is reached the oldest entry is evicted.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, maxsize: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, cached_time = entry
+            if time.time() - cached_time >= self.ttl_seconds:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value with the current timestamp"""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (value, time.time())
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
+
+def make_etag(body: bytes) -> str:
+    """Weak ETag derived from a rendered response body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+def not_modified_since(request: Request, last_modified: float) -> bool:
+    """Check If-Modified-Since against a modification timestamp (ignored when If-None-Match is sent)"""
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) <= since.timestamp()
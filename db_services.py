@@ -1,9 +1,10 @@
 """Database service functions for API endpoints"""
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc
+from sqlalchemy.orm import Session, Query, joinedload, selectinload, load_only
+from sqlalchemy import desc, asc, select, insert, update, delete, exists, literal, lambda_stmt, true
+from sqlalchemy.engine import Row
 from models import *
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime
 
@@ -97,14 +98,16 @@ class PhoneModelService:
         return base_query.filter(PhoneModel.name.ilike(f"%{name}%")).first()
     
     @staticmethod
-    def update_stock(db: Session, model_id: str, new_stock: int) -> Optional[PhoneModel]:
-        """Update model stock"""
-        model = db.query(PhoneModel).filter(PhoneModel.id == model_id).first()
-        if model:
-            model.stock = new_stock
-            model.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(model)
+    def update_stock(db: Session, model_id: str, new_stock: int) -> Optional[Row]:
+        """Update model stock with a single UPDATE ... RETURNING
+        
+        Returns the model's id, name, stock and updated_at, or None when the model doesn't exist.
+        """
+        stmt = update(PhoneModel).where(PhoneModel.id == model_id).values(
+            stock=new_stock, updated_at=datetime.utcnow()
+        ).returning(PhoneModel.id, PhoneModel.name, PhoneModel.stock, PhoneModel.updated_at)
+        model = db.execute(stmt).first()
+        db.commit()
         return model
     
     @staticmethod
@@ -155,13 +158,10 @@ class PhoneModelService:
     @staticmethod
     def delete_model(db: Session, model_id: str) -> bool:
         """Delete phone model"""
-        model = db.query(PhoneModel).filter(PhoneModel.id == model_id).first()
-        if not model:
-            return False
-        
-        db.delete(model)
+        stmt = lambda_stmt(lambda: delete(PhoneModel).where(PhoneModel.id == model_id))
+        deleted = db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
         db.commit()
-        return True
+        return deleted > 0
     
     @staticmethod
     def toggle_featured(db: Session, model_id: str) -> Optional[PhoneModel]:
@@ -175,6 +175,23 @@ class PhoneModelService:
         db.commit()
         db.refresh(model)
         return model
+    
+    @staticmethod
+    def bulk_set_available(db: Session, model_ids: List[str], is_available: bool) -> int:
+        """Set availability on several models in one UPDATE; returns the number of rows changed"""
+        updated = db.query(PhoneModel).filter(PhoneModel.id.in_(model_ids)).update(
+            {PhoneModel.is_available: is_available, PhoneModel.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        db.commit()
+        return updated
+    
+    @staticmethod
+    def bulk_delete(db: Session, model_ids: List[str]) -> int:
+        """Delete several models in one DELETE; returns the number of rows removed"""
+        deleted = db.query(PhoneModel).filter(PhoneModel.id.in_(model_ids)).delete(synchronize_session=False)
+        db.commit()
+        return deleted
 
 class TemplateService:
     """Service for template operations"""
@@ -200,7 +217,9 @@ class TemplateService:
     @staticmethod
     def update_template_price(db: Session, template_id: str, new_price: float) -> Optional[Template]:
         """Update template price"""
-        template = db.query(Template).filter(Template.id == template_id).first()
+        template = db.execute(
+            lambda_stmt(lambda: select(Template).where(Template.id == template_id))
+        ).scalar_one_or_none()
         if template:
             template.price = new_price
             template.display_price = f"£{new_price:.2f}"
@@ -208,6 +227,24 @@ class TemplateService:
             db.commit()
             db.refresh(template)
         return template
+    
+    @staticmethod
+    def batch_update_prices(db: Session, prices: Dict[str, float]) -> List[str]:
+        """Update several template prices with one executemany UPDATE and a single commit
+        
+        Returns the ids that were updated; unknown ids are skipped.
+        """
+        existing_ids = db.execute(select(Template.id).where(Template.id.in_(prices))).scalars().all()
+        if not existing_ids:
+            return []
+        
+        now = datetime.utcnow()
+        db.execute(update(Template), [
+            {"id": template_id, "price": prices[template_id], "display_price": f"£{prices[template_id]:.2f}", "updated_at": now}
+            for template_id in existing_ids
+        ])
+        db.commit()
+        return list(existing_ids)
 
 class OrderService:
     """Service for order operations"""
@@ -222,11 +259,59 @@ class OrderService:
         db.refresh(order)
         return order
     
+    @staticmethod
+    def get_order_references(db: Session, brand_id: str, model_id: str, template_id: str) -> Tuple[Optional[Brand], Optional[PhoneModel], Optional[Template]]:
+        """Fetch the brand, phone model and template for a new order in a single query
+        
+        Only the columns the order flow reads are loaded. Returns (brand, model, template);
+        any that don't exist come back as None.
+        """
+        # Explicit cross join: each table is narrowed to one row by its primary key
+        row = db.query(Brand, PhoneModel, Template).select_from(Brand).join(
+            PhoneModel, true()
+        ).join(
+            Template, true()
+        ).options(
+            load_only(Brand.name),
+            load_only(PhoneModel.name, PhoneModel.stock),
+            load_only(Template.name, Template.price)
+        ).filter(
+            Brand.id == brand_id,
+            PhoneModel.id == model_id,
+            Template.id == template_id
+        ).first()
+        if row:
+            return tuple(row)
+        
+        # At least one is missing - look each up so the caller can report which
+        return (
+            BrandService.get_brand_by_id(db, brand_id),
+            PhoneModelService.get_model_by_id(db, model_id),
+            TemplateService.get_template_by_id(db, template_id)
+        )
+    
     @staticmethod
     def get_order_by_id(db: Session, order_id: str) -> Optional[Order]:
         """Get order by ID"""
         return db.query(Order).filter(Order.id == order_id).first()
     
+    @staticmethod
+    def order_exists(db: Session, order_id: str) -> bool:
+        """Check whether an order exists without loading it"""
+        return db.query(exists().where(Order.id == order_id)).scalar()
+    
+    @staticmethod
+    def get_order_with_details(db: Session, order_id: str, include_images: bool = True) -> Optional[Order]:
+        """Get order by ID with brand, model, template (and optionally images) loaded up front"""
+        options = [
+            joinedload(Order.brand).load_only(Brand.name),
+            joinedload(Order.phone_model).load_only(PhoneModel.name),
+            joinedload(Order.template).load_only(Template.name)
+        ]
+        if include_images:
+            options.append(selectinload(Order.images))
+        return db.query(Order).options(*options).filter(Order.id == order_id).first()
+    
     @staticmethod
     def get_orders_by_status(db: Session, status: str, limit: int = 100) -> List[Order]:
         """Get orders by status"""
@@ -258,14 +343,17 @@ class OrderService:
         return order
     
     @staticmethod
-    def get_recent_orders(db: Session, limit: int = 50) -> List[Order]:
-        """Get recent orders for admin dashboard with images"""
+    def get_recent_orders(db: Session, limit: int = 50) -> Query:
+        """Query recent orders for admin dashboard with images, newest first
+        
+        Returned unexecuted so callers can either .all() it or stream it with .yield_per().
+        """
         return db.query(Order).options(
-            joinedload(Order.images),
-            joinedload(Order.brand),
-            joinedload(Order.phone_model),
-            joinedload(Order.template)
-        ).order_by(desc(Order.created_at)).limit(limit).all()
+            selectinload(Order.images),
+            joinedload(Order.brand).load_only(Brand.name),
+            joinedload(Order.phone_model).load_only(PhoneModel.name),
+            joinedload(Order.template).load_only(Template.name)
+        ).order_by(desc(Order.created_at)).limit(limit)
     
     @staticmethod
     def get_order_stats(db: Session) -> Dict[str, Any]:
@@ -341,22 +429,53 @@ class OrderImageService:
         db.refresh(image)
         return image
     
+    @staticmethod
+    def add_order_image_if_order_exists(db: Session, order_id: str, image_path: str, image_type: str = "generated", ai_params: Optional[Dict] = None) -> Optional[Row]:
+        """Add image to order with a single INSERT ... SELECT ... WHERE EXISTS
+        
+        Returns the inserted row's columns, or None when the order doesn't exist.
+        """
+        source = select(
+            literal(str(uuid.uuid4())),
+            literal(order_id),
+            literal(image_path),
+            literal(image_type),
+            literal(ai_params, type_=OrderImage.ai_params.type)
+        ).where(exists().where(Order.id == order_id))
+        stmt = insert(OrderImage).from_select(
+            ["id", "order_id", "image_path", "image_type", "ai_params"], source
+        ).returning(
+            OrderImage.id, OrderImage.order_id, OrderImage.image_path,
+            OrderImage.image_type, OrderImage.ai_params, OrderImage.created_at
+        )
+        image = db.execute(stmt).first()
+        db.commit()
+        return image
+    
     @staticmethod
     def get_order_images(db: Session, order_id: str) -> List[OrderImage]:
         """Get all images for an order"""
         return db.query(OrderImage).filter(OrderImage.order_id == order_id).order_by(OrderImage.created_at).all()
     
     @staticmethod
-    def get_all_images_with_orders(db: Session, limit: int = 100, image_type: Optional[str] = None) -> List[OrderImage]:
-        """Get all images with associated order data for admin dashboard"""
-        from sqlalchemy.orm import joinedload
+    def get_all_images_with_orders(db: Session, limit: int = 100, image_type: Optional[str] = None) -> Query:
+        """Query images newest first with associated order data for admin dashboard
         
-        query = db.query(OrderImage).options(joinedload(OrderImage.order))
+        The order's brand, model and template names are loaded in the same query
+        instead of lazily per order. Returned unexecuted so callers can either .all()
+        it or stream it with .yield_per().
+        """
+        order = joinedload(OrderImage.order)
+        query = db.query(OrderImage).options(
+            order.joinedload(Order.brand).load_only(Brand.name),
+            order.joinedload(Order.phone_model).load_only(PhoneModel.name),
+            order.joinedload(Order.template).load_only(Template.name)
+        )
         
         if image_type and image_type != 'all':
             query = query.filter(OrderImage.image_type == image_type)
         
-        return query.order_by(OrderImage.created_at.desc()).limit(limit).all()
+        return query.order_by(OrderImage.created_at.desc()).limit(limit)
 
 class FontService:
     """Service for font operations"""
@@ -423,6 +542,22 @@ class FontService:
         db.commit()
         db.refresh(font)
         return font
+    
+    @staticmethod
+    def bulk_set_active(db: Session, font_ids: List[str], is_active: bool) -> int:
+        """Set activation on several fonts in one UPDATE; returns the number of rows changed"""
+        updated = db.query(Font).filter(Font.id.in_(font_ids)).update(
+            {Font.is_active: is_active}, synchronize_session=False
+        )
+        db.commit()
+        return updated
+    
+    @staticmethod
+    def bulk_delete(db: Session, font_ids: List[str]) -> int:
+        """Delete several fonts in one DELETE; returns the number of rows removed"""
+        deleted = db.query(Font).filter(Font.id.in_(font_ids)).delete(synchronize_session=False)
+        db.commit()
+        return deleted
 
 class ColorService:
     """Service for color operations"""
@@ -488,6 +623,22 @@ class ColorService:
         db.commit()
         db.refresh(color)
         return color
+    
+    @staticmethod
+    def bulk_set_active(db: Session, color_ids: List[str], is_active: bool) -> int:
+        """Set activation on several colors in one UPDATE; returns the number of rows changed"""
+        updated = db.query(Color).filter(Color.id.in_(color_ids)).update(
+            {Color.is_active: is_active}, synchronize_session=False
+        )
+        db.commit()
+        return updated
+    
+    @staticmethod
+    def bulk_delete(db: Session, color_ids: List[str]) -> int:
+        """Delete several colors in one DELETE; returns the number of rows removed"""
+        deleted = db.query(Color).filter(Color.id.in_(color_ids)).delete(synchronize_session=False)
+        db.commit()
+        return deleted
 
 
 class VendingMachineSessionService:
@@ -4,11 +4,24 @@ Debug payment mapping database storage issue
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 
 BASE_URL = "https://pimpmycase.onrender.com"
 
+# The payment, mapping-status and admin checks below run one after another against BASE_URL,
+# so a single keep-alive connection serves them all
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+_SESSION.headers.update({
+    "User-Agent": "PimpMyCase-TestScript/1.0",
+    "Content-Type": "application/json"
+})
+
 def test_payment_mapping_debug():
     """Debug why payment mappings aren't being stored"""
     print("🔍 Debugging Payment Mapping Storage...")
@@ -25,10 +38,9 @@ def test_payment_mapping_debug():
     print(f"Creating payment with third_id: {test_payload['third_id']}")
     
     # Step 1: Create payment
-    response = requests.post(
+    response = _SESSION.post(
         f"{BASE_URL}/api/chinese/order/payData",
-        json=test_payload,
-        headers={"Content-Type": "application/json"}
+        json=test_payload
     )
     
     print(f"Payment response status: {response.status_code}")
@@ -48,12 +60,12 @@ def test_payment_mapping_debug():
             
             # Step 2: Check database directly
             print(f"Checking mapping for: {test_payload['third_id']}")
-            mapping_response = requests.get(f"{BASE_URL}/api/chinese/payment/{test_payload['third_id']}/status")
+            mapping_response = _SESSION.get(f"{BASE_URL}/api/chinese/payment/{test_payload['third_id']}/status")
             print(f"Mapping check status: {mapping_response.status_code}")
             print(f"Mapping response: {mapping_response.text}")
             
             # Step 3: Check if admin orders show the payment
-            admin_response = requests.get(f"{BASE_URL}/api/admin/orders?limit=5")
+            admin_response = _SESSION.get(f"{BASE_URL}/api/admin/orders?limit=5")
             if admin_response.status_code == 200:
                 admin_data = admin_response.json()
                 print(f"Recent orders count: {len(admin_data.get('orders', []))}")
@@ -78,7 +90,7 @@ def test_admin_endpoints():
     print("\n🔍 Testing Admin Endpoints...")
     
     # Test database stats
-    stats_response = requests.get(f"{BASE_URL}/api/admin/database-stats")
+    stats_response = _SESSION.get(f"{BASE_URL}/api/admin/database-stats")
     if stats_response.status_code == 200:
         stats_data = stats_response.json()
         print(f"Database stats: {json.dumps(stats_data, indent=2)}")
@@ -86,7 +98,7 @@ def test_admin_endpoints():
         print(f"Database stats failed: {stats_response.status_code}")
     
     # Test recent orders
-    orders_response = requests.get(f"{BASE_URL}/api/admin/orders?limit=3")
+    orders_response = _SESSION.get(f"{BASE_URL}/api/admin/orders?limit=3")
     if orders_response.status_code == 200:
         orders_data = orders_response.json()
         print(f"Recent orders: {len(orders_data.get('orders', []))}")
@@ -4,9 +4,22 @@ Debug script to test vending machine registration manually and see detailed erro
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
 
+# The register call reuses the connection opened by the session-create call; retries cover the
+# 502/503s Render returns while the service is waking up
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+_SESSION.headers.update({
+    "User-Agent": "PimpMyCase-TestScript/1.0",
+    "Content-Type": "application/json"
+})
+
 def test_registration_debug():
     """Test the registration endpoint with detailed debugging"""
     
@@ -27,10 +40,9 @@ def test_registration_debug():
     }
     
     try:
-        create_response = requests.post(
+        create_response = _SESSION.post(
             f"{base_url}/api/vending/create-session",
             json=create_payload,
-            headers={"Content-Type": "application/json"},
             timeout=10
         )
         
@@ -66,10 +78,9 @@ def test_registration_debug():
     }
     
     try:
-        register_response = requests.post(
+        register_response = _SESSION.post(
             f"{base_url}/api/vending/session/{session_id}/register-user",
             json=register_payload,
-            headers={"Content-Type": "application/json"},
             timeout=10
         )
         
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add indexes used by the order listing and stats queries
+create_tables() only creates indexes for new tables, so existing databases need this once
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from database import engine
+
+# (index name, table, column list)
+ORDER_INDEXES = [
+    ("idx_orders_created_at", "orders", "created_at DESC"),
+    ("idx_orders_status_created_at", "orders", "status, created_at DESC"),
+    ("idx_order_images_order_id", "order_images", "order_id"),
+]
+
+def create_order_indexes() -> bool:
+    """Create the order indexes if they don't exist"""
+    try:
+        is_postgres = engine.dialect.name == "postgresql"
+        # CONCURRENTLY avoids locking the orders table on a live database but can't run inside a transaction
+        concurrently = "CONCURRENTLY " if is_postgres else ""
+        
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for index_name, table_name, columns in ORDER_INDEXES:
+                print(f"🔄 Creating index {index_name} on {table_name}({columns})...")
+                connection.execute(text(
+                    f"CREATE INDEX {concurrently}IF NOT EXISTS {index_name} ON {table_name} ({columns})"
+                ))
+                print(f"✅ Index {index_name} is in place")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Failed to create order indexes: {e}")
+        return False
+
+def main():
+    """Run the migration"""
+    print("🚀 Starting database migration...")
+    print(f"Database URL: {engine.url}")
+    
+    if not create_order_indexes():
+        print("❌ Migration failed")
+        return False
+    
+    print("🎉 Migration completed successfully!")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Database migration script to store order_images.ai_params as JSONB with a GIN index
+Only applies to PostgreSQL; SQLite databases keep the plain JSON column
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from database import engine
+
+def convert_ai_params_to_jsonb() -> bool:
+    """Change the ai_params column type to JSONB and add the GIN index"""
+    try:
+        if engine.dialect.name != "postgresql":
+            print("ℹ️ Not a PostgreSQL database, nothing to do")
+            return True
+        
+        with engine.begin() as connection:
+            column_type = connection.execute(text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = 'order_images' AND column_name = 'ai_params'"
+            )).scalar()
+            
+            if column_type == "jsonb":
+                print("✅ order_images.ai_params is already JSONB")
+            else:
+                print(f"🔄 Converting order_images.ai_params from {column_type} to JSONB...")
+                connection.execute(text(
+                    "ALTER TABLE order_images ALTER COLUMN ai_params TYPE JSONB USING ai_params::jsonb"
+                ))
+                print("✅ order_images.ai_params converted")
+        
+        # CONCURRENTLY avoids locking order_images on a live database but can't run inside a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            print("🔄 Creating GIN index idx_order_images_ai_params...")
+            connection.execute(text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_order_images_ai_params "
+                "ON order_images USING GIN (ai_params jsonb_path_ops)"
+            ))
+            print("✅ Index idx_order_images_ai_params is in place")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Failed to convert ai_params to JSONB: {e}")
+        return False
+
+def main():
+    """Run the migration"""
+    print("🚀 Starting database migration...")
+    print(f"Database URL: {engine.url}")
+    
+    if not convert_ai_params_to_jsonb():
+        print("❌ Migration failed")
+        return False
+    
+    print("🎉 Migration completed successfully!")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
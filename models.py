@@ -1,6 +1,7 @@
 """SQLAlchemy models for the phone case customization platform"""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, DECIMAL, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, DECIMAL, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -220,6 +221,11 @@ class Order(Base):
     vending_machine = relationship("VendingMachine", back_populates="orders")
     images = relationship("OrderImage", back_populates="order", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("idx_orders_created_at", created_at.desc()),  # Admin "recent orders" listing
+        Index("idx_orders_status_created_at", status, created_at.desc()),  # Status counts and filtered listings
+    )
+
 class OrderImage(Base):
     """Generated images for orders"""
     __tablename__ = "order_images"
@@ -228,13 +234,18 @@ class OrderImage(Base):
     order_id = Column(String, ForeignKey("orders.id"), nullable=False)
     image_path = Column(String(500), nullable=False)  # Path to stored image
     image_type = Column(String(50), default="generated")  # generated, uploaded, final
-    ai_params = Column(JSON)  # AI generation parameters used
+    ai_params = Column(JSON().with_variant(JSONB(), "postgresql"))  # AI generation parameters used (JSONB on Postgres)
     chinese_image_url = Column(String(500))  # Download URL for Chinese partners
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     order = relationship("Order", back_populates="images")
 
+    __table_args__ = (
+        Index("idx_order_images_order_id", order_id),  # Loading images for a batch of orders
+        Index("idx_order_images_ai_params", ai_params, postgresql_using="gin", postgresql_ops={"ai_params": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),  # ai_params @> containment filters
+    )
+
 class PaymentMapping(Base):
     """Persistent mapping between frontend payment IDs (PYEN...) and Chinese payment IDs (MSPY...)"""
     __tablename__ = "payment_mappings"